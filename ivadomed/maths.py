@@ -1,6 +1,7 @@
 import numpy as np
 import os
 import scipy.signal
+import scipy.stats
 
 
 def rescale_values_array(arr, minv=0.0, maxv=1.0, dtype=np.float32):
@@ -13,7 +14,7 @@ def rescale_values_array(arr, minv=0.0, maxv=1.0, dtype=np.float32):
         dtype (type): Cast array to this type before performing the rescaling.
     """
     if dtype is not None:
-        arr = arr.astype(dtype)
+        arr = arr.astype(dtype, copy=False)
 
     mina = np.min(arr)
     maxa = np.max(arr)
@@ -21,8 +22,15 @@ def rescale_values_array(arr, minv=0.0, maxv=1.0, dtype=np.float32):
     if mina == maxa:
         return arr * minv
 
-    norm = (arr - mina) / (maxa - mina)  # normalize the array first
-    return (norm * (maxv - minv)) + minv  # rescale by minv and maxv, which is the normalized array by default
+    # Work in place on a single temporary; dividing (rather than multiplying by the reciprocal) keeps maxv exact
+    rescaled = arr - mina
+    if rescaled.dtype.kind == 'f':
+        rescaled /= maxa - mina
+    else:
+        rescaled = rescaled / (maxa - mina)
+    rescaled *= maxv - minv
+    rescaled += minv
+    return rescaled
 
 
 def gaussian_kernel(kernlen=10):
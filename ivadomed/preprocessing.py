@@ -9,7 +9,7 @@ def get_midslice_average(path_im, ind, slice_axis=0):
     Extract an average 2D slice out of a 3D volume. This image is generated by
     averaging the 7 slices in the middle of the volume
     Args:
-        path_im (string): path to image
+        path_im (string or nibabel): path to image, or image already loaded with nibabel
         ind (int): index of the slice around which we will average
         slice_axis (int): Slice axis according to RAS convention
 
@@ -17,22 +17,23 @@ def get_midslice_average(path_im, ind, slice_axis=0):
         nifti: a single slice nifti object containing the average image in the image space.
 
     """
-    image = nib.load(path_im)
+    image = path_im if isinstance(path_im, nib.spatialimages.SpatialImage) else nib.load(path_im)
     image_can = nib.as_closest_canonical(image)
-    arr_can = np.array(image_can.dataobj)
+    shape_can = image_can.shape
     numb_of_slice = 3
     # Avoid out of bound error by changing the number of slice taken if needed
-    if ind + 3 > arr_can.shape[slice_axis]:
-        numb_of_slice = arr_can.shape[slice_axis] - ind
+    if ind + 3 > shape_can[slice_axis]:
+        numb_of_slice = shape_can[slice_axis] - ind
     if ind - numb_of_slice < 0:
         numb_of_slice = ind
 
-    slc = [slice(None)] * len(arr_can.shape)
+    slc = [slice(None)] * len(shape_can)
     slc[slice_axis] = slice(ind - numb_of_slice, ind + numb_of_slice)
-    mid = np.mean(arr_can[tuple(slc)], slice_axis)
+    # Only read the averaged slices, the array proxy does not load the whole volume
+    arr_slc = np.asanyarray(image_can.dataobj[tuple(slc)])
+    mid = np.mean(arr_slc, slice_axis, dtype=np.float32)
 
-    arr_pred_ref_space = imed_loader_utils.reorient_image(np.expand_dims(mid[:, :], axis=slice_axis), 2, image,
-                                                   image_can).astype('float32')
+    arr_pred_ref_space = imed_loader_utils.reorient_image(np.expand_dims(mid, axis=slice_axis), 2, image, image_can)
     nib_pred = nib.Nifti1Image(arr_pred_ref_space, image.affine)
 
     return nib_pred
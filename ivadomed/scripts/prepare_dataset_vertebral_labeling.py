@@ -1,4 +1,6 @@
 import argparse
+import multiprocessing as mp
+from functools import partial
 import ivadomed.utils as imed_utils
 import ivadomed.preprocessing as imed_preprocessing
 import nibabel as nib
@@ -12,32 +14,31 @@ def mask2label(path_label, aim=0):
     """
     Retrieve points coordinates and value from a label file containing singl voxel label
     Args:
-        path_label (str): path of nifti image
+        path_label (str or nibabel): path of nifti image, or nifti image already loaded with nibabel
         aim (int): -1 will return all points with label between 3 and 30 , any other int > 0  will return
         only the coordinates of points with label defined by aim.
 
     Returns:
-        ndarray: array containing the asked point in the format [x,y,z,value] in the RAS orientation.
+        ndarray: integer array containing the asked point in the format [x,y,z,value] in the RAS orientation,
+        sorted by value. Label values are truncated to integers.
 
     """
-    image = nib.load(path_label)
+    image = path_label if isinstance(path_label, nib.spatialimages.SpatialImage) else nib.load(path_label)
     image = nib.as_closest_canonical(image)
-    arr = np.array(image.dataobj)
-    list_label_image = []
+    # No copy nor float promotion needed, only the voxel coordinates and their label value are used
+    arr = np.asanyarray(image.dataobj)
     # Arr non zero used since these are single voxel label
-    for i in range(len(arr.nonzero()[0])):
-        x = arr.nonzero()[0][i]
-        y = arr.nonzero()[1][i]
-        z = arr.nonzero()[2][i]
-        # need to check every points
-        if aim == 0:
-            # we don't want to account for pmj (label 49) nor C1/C2 which is hard to distinguish.
-            if arr[x, y, z] < 30 and arr[x, y, z] != 1:
-                list_label_image.append([x, y, z, arr[x, y, z]])
-        elif aim > 0:
-            if arr[x, y, z] == aim:
-                list_label_image.append([x, y, z, arr[x, y, z]])
-    list_label_image.sort(key=lambda x: x[3])
+    coord = np.argwhere(arr)
+    values = arr[tuple(coord.T)]
+    if aim == 0:
+        # we don't want to account for pmj (label 49) nor C1/C2 which is hard to distinguish.
+        keep = (values < 30) & (values != 1)
+    elif aim > 0:
+        keep = values == aim
+    else:
+        keep = np.zeros(values.shape, dtype=bool)
+    list_label_image = np.column_stack([coord[keep], values[keep].astype(coord.dtype)])
+    list_label_image = list_label_image[list_label_image[:, 3].argsort(kind='stable')]
     return list_label_image
 
 
@@ -63,32 +64,35 @@ def extract_mid_slice_and_convert_coordinates_to_heatmaps(path, suffix, aim=-1):
     t = os.listdir(path)
     t.remove('derivatives')
 
-    for i in range(len(t)):
-        sub = t[i]
-        path_image = os.path.join(path, t[i], 'anat', t[i] + suffix + '.nii.gz')
-        if os.path.isfile(path_image):
-            path_label = os.path.join(path, 'derivatives', 'labels', t[i], 'anat', t[i] + suffix +
-                    '_labels-disc-manual.nii.gz')
-            list_points = mask2label(path_label, aim=aim)
-            image_ref = nib.load(path_image)
-            nib_ref_can = nib.as_closest_canonical(image_ref)
-            imsh = np.array(nib_ref_can.dataobj).shape
-            mid_nifti = imed_preprocessing.get_midslice_average(path_image, list_points[0][0], slice_axis=0)
-            nib.save(mid_nifti, os.path.join(path, t[i], 'anat', t[i] + suffix + '_mid.nii.gz'))
-            lab = nib.load(path_label)
-            nib_ref_can = nib.as_closest_canonical(lab)
-            label_array = np.zeros(imsh[1:])
-
-            for j in range (len(list_points)):
-                label_array[list_points[j][1], list_points[j][2]] = 1
-
-            heatmap = imed_maths.heatmap_generation(label_array[:, :], 10)
-            arr_pred_ref_space = imed_loader_utils.reorient_image(np.expand_dims(heatmap[:, :], axis=0), 2, lab, nib_ref_can)
-            nib_pred = nib.Nifti1Image(arr_pred_ref_space, lab.affine)
-            nib.save(nib_pred, os.path.join(path, 'derivatives', 'labels', t[i], 'anat', t[i] + suffix +
-                                            '_mid_heatmap' + str(aim) + '.nii.gz'))
-        else:
-            pass
+    # Subjects are independent from each other, so they are processed on separate processes
+    with mp.Pool() as pool:
+        pool.map(partial(_process_subject, path=path, suffix=suffix, aim=aim), t)
+
+
+def _process_subject(sub, path, suffix, aim):
+    """Generate the mid-sagittal image and heatmap of a single subject, see
+    :func:`extract_mid_slice_and_convert_coordinates_to_heatmaps`.
+    """
+    path_anat = os.path.join(path, sub, 'anat')
+    path_label_anat = os.path.join(path, 'derivatives', 'labels', sub, 'anat')
+    prefix = sub + suffix
+    path_image = os.path.join(path_anat, prefix + '.nii.gz')
+    if os.path.isfile(path_image):
+        path_label = os.path.join(path_label_anat, prefix + '_labels-disc-manual.nii.gz')
+        # Load and reorient each file only once; the heatmap is written in the label space
+        lab = nib.load(path_label)
+        nib_ref_can = nib.as_closest_canonical(lab)
+        list_points = mask2label(nib_ref_can, aim=aim)
+        image_ref = nib.load(path_image)
+        mid_nifti = imed_preprocessing.get_midslice_average(image_ref, list_points[0, 0], slice_axis=0)
+        nib.save(mid_nifti, os.path.join(path_anat, prefix + '_mid.nii.gz'))
+        label_array = np.zeros(nib_ref_can.shape[1:], dtype=np.float32)
+        label_array[list_points[:, 1], list_points[:, 2]] = 1
+
+        heatmap = imed_maths.heatmap_generation(label_array[:, :], 10)
+        arr_pred_ref_space = imed_loader_utils.reorient_image(np.expand_dims(heatmap[:, :], axis=0), 2, lab, nib_ref_can)
+        nib_pred = nib.Nifti1Image(arr_pred_ref_space, lab.affine)
+        nib.save(nib_pred, os.path.join(path_label_anat, prefix + '_mid_heatmap' + str(aim) + '.nii.gz'))
 
 
 def get_parser():
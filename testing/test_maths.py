@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8
+# pytest unit tests for ivadomed.maths
+
+
+import numpy as np
+import pytest
+import scipy.signal
+
+from ivadomed import maths as imed_maths
+
+
+def test_heatmap_generation_single_point():
+    image = np.zeros((15, 15))
+    image[7, 7] = 1
+    heatmap = imed_maths.heatmap_generation(image, 10)
+
+    expected_profile = [0., 0., 0., 0.401632, 0.612823, 0.794849, 0.928873, 1., 1., 0.928873, 0.794849, 0.612823,
+                        0.401632, 0., 0.]
+    assert heatmap.dtype == np.float32
+    assert np.allclose(heatmap[7, :], expected_profile, atol=1e-5)
+    assert np.allclose(heatmap[:, 7], expected_profile, atol=1e-5)
+    assert np.unravel_index(np.argmax(heatmap), heatmap.shape) == (7, 7)
+
+
+@pytest.mark.parametrize('kernel_size', [1, 2, 3, 4, 9, 10])
+def test_heatmap_generation_matches_convolution(kernel_size):
+    image = np.zeros((40, 33))
+    image[[0, 8, 20, 21, 39], [0, 6, 15, 30, 32]] = 1
+    heatmap = imed_maths.heatmap_generation(image, kernel_size)
+
+    kernel = imed_maths.gaussian_kernel(kernel_size)
+    expected = imed_maths.rescale_values_array(scipy.signal.convolve(image, kernel, mode='same'))
+    assert np.allclose(heatmap, expected, atol=1e-5)
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64, None])
+def test_rescale_values_array(dtype):
+    rng = np.random.RandomState(0)
+    for _ in range(100):
+        arr = rng.normal(size=(32, 32)).astype(np.float32) * 100
+        arr_copy = arr.copy()
+        rescaled = imed_maths.rescale_values_array(arr, minv=-1.0, maxv=2.0, dtype=dtype)
+        assert rescaled.dtype == (dtype or np.float32)
+        assert rescaled.min() == -1.0
+        assert rescaled.max() == 2.0
+        assert np.array_equal(arr, arr_copy)
+
+        rescaled = imed_maths.rescale_values_array(arr, dtype=dtype)
+        assert rescaled.min() == 0.0
+        assert rescaled.max() == 1.0
+
+
+def test_rescale_values_array_integer_input():
+    rescaled = imed_maths.rescale_values_array(np.array([2, 4, 6], dtype=np.int16), dtype=None)
+    assert rescaled.dtype == np.float64
+    assert np.array_equal(rescaled, [0., 0.5, 1.])
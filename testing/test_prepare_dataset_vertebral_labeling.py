@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8
+# pytest unit tests for ivadomed.scripts.prepare_dataset_vertebral_labeling
+
+
+import nibabel as nib
+import numpy as np
+import pytest
+
+from ivadomed.scripts import prepare_dataset_vertebral_labeling as imed_vertebral_labeling
+
+
+def label_image(dtype=np.int16):
+    arr = np.zeros((6, 7, 8), dtype=dtype)
+    arr[1, 2, 3] = 5
+    arr[4, 1, 2] = 3
+    arr[0, 6, 7] = 5
+    arr[2, 2, 2] = 1
+    arr[3, 3, 3] = 49
+    arr[5, 0, 1] = 3
+    return arr
+
+
+@pytest.mark.parametrize('dtype', [np.int16, np.uint8, np.float32])
+@pytest.mark.parametrize('aim,expected', [
+    # Labels 1 and 49 are ignored, equal labels keep the voxel order
+    (0, [[4, 1, 2, 3], [5, 0, 1, 3], [0, 6, 7, 5], [1, 2, 3, 5]]),
+    (5, [[0, 6, 7, 5], [1, 2, 3, 5]]),
+    (-1, np.zeros((0, 4))),
+])
+def test_mask2label(aim, expected, dtype):
+    nib_label = nib.Nifti1Image(label_image(dtype), np.eye(4))
+    list_points = imed_vertebral_labeling.mask2label(nib_label, aim=aim)
+    assert np.issubdtype(list_points.dtype, np.integer)
+    assert np.array_equal(list_points, expected)
+
+
+def test_mask2label_reorient(tmp_path):
+    # LPI image: the first two axes are flipped to get RAS coordinates
+    affine = np.diag([-1, -1, 1, 1])
+    path_label = tmp_path / 'label.nii.gz'
+    nib.save(nib.Nifti1Image(label_image(), affine), str(path_label))
+    list_points = imed_vertebral_labeling.mask2label(path_label, aim=5)
+    assert np.array_equal(list_points, [[4, 4, 3, 5], [5, 0, 7, 5]])